@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import json
 import os
 import re
@@ -15,6 +16,9 @@ SCOPES = ["https://www.googleapis.com/auth/spreadsheets.readonly"]
 DEFAULT_RANGE = "testcase!A1:E100"  # 기본값을 당신 프로젝트 기준으로 맞춰둠 (원하면 Sheet1로 바꿔도 됨)
 TOKEN_URI = "https://oauth2.googleapis.com/token"
 
+# URL 패턴에서 /d/<ID>/ 추출 (호출마다 컴파일하지 않게 모듈 레벨에 둠)
+_SHEET_ID_RE = re.compile(r"/spreadsheets/d/([a-zA-Z0-9_-]+)")
+
 
 def _normalize_sheet_id(spreadsheet_id: str) -> str:
     """
@@ -25,8 +29,7 @@ def _normalize_sheet_id(spreadsheet_id: str) -> str:
     if not s:
         return s
 
-    # URL 패턴에서 /d/<ID>/ 추출
-    m = re.search(r"/spreadsheets/d/([a-zA-Z0-9-_]+)", s)
+    m = _SHEET_ID_RE.search(s)
     if m:
         return m.group(1)
 
@@ -70,11 +73,15 @@ def _loads_credentials_json(raw: str) -> Dict[str, Any]:
         ) from e
 
 
+@functools.lru_cache(maxsize=1)
 def _build_credentials() -> Credentials:
     """
     우선순위
     1) GOOGLE_CREDENTIALS_JSON (권장: 로컬/CI 공통)
     2) GOOGLE_APPLICATION_CREDENTIALS 파일 경로 (대안)
+
+    호출마다 파일 읽기 + JSON 파싱 + 토큰 교환을 반복하지 않도록 캐시.
+    access token 만료 시 갱신은 google-auth가 알아서 해줌.
     """
     raw = os.getenv("GOOGLE_CREDENTIALS_JSON")
     if raw:
@@ -96,57 +103,101 @@ def _build_credentials() -> Credentials:
     return Credentials.from_service_account_info(info, scopes=SCOPES)
 
 
-def load_cases_from_sheets(
-    spreadsheet_id: str,
-    range_name: str = DEFAULT_RANGE,
-) -> List[TestCase]:
-    spreadsheet_id = _normalize_sheet_id(spreadsheet_id)
-    if not spreadsheet_id:
-        return []
-
+@functools.lru_cache(maxsize=1)
+def _get_service():
+    """
+    discovery 문서 fetch/파싱이 호출마다 수백 ms씩 먹기 때문에
+    service 객체는 프로세스당 한 번만 만들어서 재사용.
+    """
     creds = _build_credentials()
-
     # cache_discovery=False: github actions 같은 환경에서 불필요한 캐시/경고 줄임
-    service = build("sheets", "v4", credentials=creds, cache_discovery=False)
-
-    result = (
-        service.spreadsheets()
-        .values()
-        .get(spreadsheetId=spreadsheet_id, range=range_name)
-        .execute()
+    # static_discovery=True: 번들된 discovery 문서 사용 → 네트워크 fetch 자체를 생략
+    return build(
+        "sheets", "v4", credentials=creds, cache_discovery=False, static_discovery=True
     )
 
-    values = result.get("values", [])
+
+def _rows_to_cases(values: List[List[Any]]) -> List[TestCase]:
+    """
+    시트 값(헤더 행 + 데이터 행)을 TestCase 리스트로 변환.
+    파싱 로직을 한 곳에 모아두면 range가 늘어나도 재사용할 수 있음.
+    """
     if not values:
         return []
 
-    headers = [h.strip() for h in values[0]]
-    cases: List[TestCase] = []
-
-    for row in values[1:]:
-        # row 길이가 header보다 짧아도 안전하게 zip
-        data = dict(zip(headers, row))
-
-        # 초보자 방어: 컬럼명이 대소문자/공백 차이 날 수 있음
-        # 필요한 키를 정규화해서 가져오기
-        def _get(key: str) -> str:
-            for k, v in data.items():
-                if k.strip().lower() == key.strip().lower():
-                    return str(v).strip()
+    # 초보자 방어: 컬럼명이 대소문자/공백 차이 날 수 있음 → 정규화해서 인덱스 맵 구성
+    # (행마다 dict 만들고 키를 스캔하는 대신, 컬럼 위치를 한 번만 계산)
+    header_idx = {str(h).strip().lower(): i for i, h in enumerate(values[0])}
+    col_id = header_idx.get("id")
+    col_engine = header_idx.get("engine")
+    col_name = header_idx.get("name")
+    col_url = header_idx.get("url")
+    col_assert = header_idx.get("assert_title_contains")
+
+    def _cell(row: List[Any], col) -> str:
+        # row 길이가 header보다 짧아도 안전하게
+        if col is None or col >= len(row):
             return ""
+        return str(row[col]).strip()
 
-        tc_id = _get("id")
+    cases: List[TestCase] = []
+    for row in values[1:]:
+        tc_id = _cell(row, col_id)
         if not tc_id:
             continue
 
         cases.append(
             TestCase(
                 id=tc_id,
-                engine=_get("engine"),
-                name=_get("name"),
-                url=_get("url"),
-                assert_title_contains=_get("assert_title_contains"),
+                engine=_cell(row, col_engine),
+                name=_cell(row, col_name),
+                url=_cell(row, col_url),
+                assert_title_contains=_cell(row, col_assert),
             )
         )
 
     return cases
+
+
+def load_ranges(
+    spreadsheet_id: str,
+    ranges: List[str],
+) -> List[List[List[Any]]]:
+    """
+    여러 range를 batchGet 한 번으로 읽어서 range별 values 리스트로 반환.
+    (N개의 values.get = N번 round-trip → 1번으로 합침, 쿼터도 1회로 계산됨)
+    """
+    spreadsheet_id = _normalize_sheet_id(spreadsheet_id)
+    if not spreadsheet_id or not ranges:
+        return [[] for _ in ranges]
+
+    service = _get_service()
+
+    # fields 마스크로 응답에서 메타데이터를 빼서 파싱량을 줄임
+    result = (
+        service.spreadsheets()
+        .values()
+        .batchGet(
+            spreadsheetId=spreadsheet_id,
+            ranges=ranges,
+            majorDimension="ROWS",
+            valueRenderOption="UNFORMATTED_VALUE",
+            fields="valueRanges(values)",
+        )
+        .execute()
+    )
+
+    value_ranges = result.get("valueRanges", [])
+    # range 수보다 응답이 짧아도 자리 맞춰서 반환
+    return [
+        (value_ranges[i].get("values", []) if i < len(value_ranges) else [])
+        for i in range(len(ranges))
+    ]
+
+
+def load_cases_from_sheets(
+    spreadsheet_id: str,
+    range_name: str = DEFAULT_RANGE,
+) -> List[TestCase]:
+    values = load_ranges(spreadsheet_id, [range_name])[0]
+    return _rows_to_cases(values)
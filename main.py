@@ -1,26 +1,37 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
 import json
 import os
 import time
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Optional
+from typing import List, NamedTuple, Optional
 
-from playwright.sync_api import sync_playwright
+from playwright.async_api import async_playwright
+
+try:
+    import orjson
+except ImportError:  # orjson이 없어도 stdlib json으로 동작
+    orjson = None
 
 ROOT = Path(__file__).resolve().parent
 HISTORY_DIR = ROOT / "history"
 HISTORY_FILE = HISTORY_DIR / "test_history.json"
+SUMMARY_FILE = HISTORY_DIR / "history_summary.json"
+
+# 동시에 돌릴 케이스 수 (네트워크 대기가 대부분이라 순차 실행은 느림)
+MAX_WORKERS = int(os.getenv("QA_MAX_WORKERS", "8"))
 
 
 # -----------------------------
 # Models
 # -----------------------------
-@dataclass(frozen=True)
-class TestCase:
+# NamedTuple: frozen dataclass처럼 불변이지만, 생성이 C 레벨 tuple 할당이라
+# 행이 많아져도 per-row 생성 비용이 거의 없음
+class TestCase(NamedTuple):
     id: str
     engine: str
     name: str
@@ -28,7 +39,7 @@ class TestCase:
     assert_title_contains: str
 
 
-@dataclass
+@dataclass(slots=True)
 class TestResult:
     id: str
     engine: str
@@ -42,6 +53,14 @@ class TestResult:
     error: Optional[str] = None
 
 
+# asdict()는 deepcopy 기반이라 느림 → 필드명을 한 번만 뽑아서 얕은 dict로 변환
+_TR_FIELDS = tuple(f.name for f in fields(TestResult))
+
+
+def result_to_dict(r: TestResult) -> dict:
+    return {k: getattr(r, k) for k in _TR_FIELDS}
+
+
 # -----------------------------
 # Utils
 # -----------------------------
@@ -49,28 +68,54 @@ def utc_now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+def _dumps_line(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _loads(raw):
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def summary_to_cards(summary: dict) -> dict:
+    """run summary에서 카드용 수치(pass/fail/error/rate)를 계산."""
+    p = int(summary.get("pass", 0) or 0)
+    f = int(summary.get("fail", 0) or 0)
+    e = int(summary.get("error", 0) or 0)
+    denom = p + f + e
+    rate = int(round((p / denom) * 100)) if denom else 0
+    return {"pass": p, "fail": f, "error": e, "rate": rate}
+
+
 def ensure_history_file() -> None:
     HISTORY_DIR.mkdir(parents=True, exist_ok=True)
     if not HISTORY_FILE.exists():
-        HISTORY_FILE.write_text("[]", encoding="utf-8")
+        HISTORY_FILE.write_bytes(b"")
 
 
-def append_run_history(results: List[TestResult]) -> None:
+def _migrate_history_to_ndjson() -> None:
     """
-    History format (runs):
-    [
-      {
-        "executed_at": "...",
-        "summary": {"pass": 1, "fail": 0, "error": 0},
-        "results": [ {TestResult...}, ... ]
-      },
-      ...
-    ]
+    예전 포맷(JSON 배열 전체를 매번 다시 쓰는 방식)을 NDJSON으로 1회 변환.
+    변환 후에는 append가 O(1)이라 history가 커져도 쓰기 비용이 안 늘어남.
     """
-    ensure_history_file()
+    # append마다 전체 파일을 읽지 않도록, 먼저 첫 바이트만 보고 포맷을 판별
+    try:
+        with open(HISTORY_FILE, "rb") as f:
+            head = f.read(1)
+            while head and head.isspace():
+                head = f.read(1)
+            if head != b"[":
+                return  # 이미 NDJSON (또는 빈 파일)
+            f.seek(0)
+            raw = f.read()
+    except OSError:
+        return
 
     try:
-        existing = json.loads(HISTORY_FILE.read_text(encoding="utf-8"))
+        existing = _loads(raw)
     except Exception:
         existing = []
 
@@ -83,38 +128,97 @@ def append_run_history(results: List[TestResult]) -> None:
     if not isinstance(existing, list):
         existing = []
 
+    HISTORY_FILE.write_bytes(b"".join(_dumps_line(rec) + b"\n" for rec in existing))
+
+
+def append_run_history(results: List[TestResult]) -> None:
+    """
+    History format: NDJSON (한 줄 = run 하나)
+    {
+      "executed_at": "...",
+      "summary": {"pass": 1, "fail": 0, "error": 0},
+      "results": [ {TestResult...}, ... ]
+    }
+    """
+    ensure_history_file()
+    _migrate_history_to_ndjson()
+
     passed = sum(1 for r in results if r.status == "pass")
     failed = sum(1 for r in results if r.status == "fail")
     errored = sum(1 for r in results if r.status == "error")
 
+    summary = {"pass": passed, "fail": failed, "error": errored}
     run_record = {
         "executed_at": utc_now_iso(),
-        "summary": {"pass": passed, "fail": failed, "error": errored},
-        "results": [asdict(r) for r in results],
+        "summary": summary,
+        # 대시보드 카드용 수치는 렌더마다 재계산하지 않게 쓸 때 한 번만 계산
+        "cards": summary_to_cards(summary),
+        "results": [result_to_dict(r) for r in results],
     }
 
-    existing.append(run_record)
+    with open(HISTORY_FILE, "ab") as f:
+        f.write(_dumps_line(run_record) + b"\n")
+
+    _write_history_summary(run_record)
+
 
-    HISTORY_FILE.write_text(
-        json.dumps(existing, ensure_ascii=False, indent=2),
-        encoding="utf-8",
+def _write_history_summary(run_record: dict) -> None:
+    """
+    대시보드 카드가 history 전체를 읽지 않도록, 최신 run 요약만 담은
+    사이드카 파일을 run이 끝날 때마다 갱신.
+    """
+    prev_total = 0
+    try:
+        prev = _loads(SUMMARY_FILE.read_bytes())
+        prev_total = int(prev.get("total_runs", 0))
+    except Exception:
+        # 사이드카가 없거나 깨졌으면 한 번만 라인 수를 센다
+        try:
+            with open(HISTORY_FILE, "rb") as f:
+                prev_total = sum(1 for line in f if line.strip()) - 1
+        except OSError:
+            prev_total = 0
+
+    SUMMARY_FILE.write_bytes(
+        _dumps_line(
+            {
+                "last_run_executed_at": run_record["executed_at"],
+                "last_run_summary": run_record["summary"],
+                "last_run_cards": run_record.get("cards")
+                or summary_to_cards(run_record.get("summary") or {}),
+                "total_runs": max(prev_total, 0) + 1,
+            }
+        )
     )
 
 
 # -----------------------------
 # Engines
 # -----------------------------
-def run_case_playwright(case: TestCase) -> TestResult:
+# 검증 대상이 <title>뿐이라 무거운 리소스는 다운로드 자체를 막음
+_SKIP_RESOURCE_TYPES = {"image", "media", "font", "stylesheet"}
+
+
+async def _route_skip_heavy(route) -> None:
+    if route.request.resource_type in _SKIP_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def run_case_playwright_async(browser, case: TestCase) -> TestResult:
     started = utc_now_iso()
     t0 = time.time()
 
     try:
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page()
-            page.goto(case.url, wait_until="domcontentloaded", timeout=30_000)
-
-            title = page.title()
+        # 브라우저는 run 전체에서 하나만 쓰고, 케이스는 context로만 격리
+        context = await browser.new_context()
+        try:
+            await context.route("**/*", _route_skip_heavy)
+            page = await context.new_page()
+            await page.goto(case.url, wait_until="domcontentloaded", timeout=30_000)
+
+            title = await page.title()
             if case.assert_title_contains not in title:
                 status = "fail"
                 err = (
@@ -125,8 +229,8 @@ def run_case_playwright(case: TestCase) -> TestResult:
             else:
                 status = "pass"
                 err = None
-
-            browser.close()
+        finally:
+            await context.close()
 
         finished = utc_now_iso()
         duration_ms = int((time.time() - t0) * 1000)
@@ -162,31 +266,47 @@ def run_case_playwright(case: TestCase) -> TestResult:
 # -----------------------------
 # Runner
 # -----------------------------
-def run_all(cases: List[TestCase]) -> List[TestResult]:
-    results: List[TestResult] = []
-    for case in cases:
-        if case.engine != "playwright":
-            results.append(
-                TestResult(
-                    id=case.id,
-                    engine=case.engine,
-                    name=case.name,
-                    url=case.url,
-                    status="error",
-                    started_at=utc_now_iso(),
-                    finished_at=utc_now_iso(),
-                    duration_ms=0,
-                    error=f"Unsupported engine: {case.engine}",
-                )
-            )
-            continue
-
-        print(f"Running {case.id} - {case.name}")
-        r = run_case_playwright(case)
-        results.append(r)
-        print(f" -> {r.status.upper()}" + (f" ({r.error})" if r.error else ""))
-
-    return results
+async def run_all_async(cases: List[TestCase], log=print) -> List[TestResult]:
+    # 이벤트 루프 하나가 브라우저 하나 위에서 N개의 페이지를 동시에 굴림.
+    # 스레드 N개 + 브라우저 N개보다 메모리가 훨씬 적게 듦.
+    # log: 진행 로그를 받을 callable — 프로세스 전역 stdout을 바꿔치기하지 않고
+    # 호출자가 run별 로그 파일 등으로 돌릴 수 있게 함
+    sem = asyncio.Semaphore(MAX_WORKERS)
+
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        try:
+
+            async def _one(case: TestCase) -> TestResult:
+                if case.engine != "playwright":
+                    return TestResult(
+                        id=case.id,
+                        engine=case.engine,
+                        name=case.name,
+                        url=case.url,
+                        status="error",
+                        started_at=utc_now_iso(),
+                        finished_at=utc_now_iso(),
+                        duration_ms=0,
+                        error=f"Unsupported engine: {case.engine}",
+                    )
+
+                async with sem:
+                    log(f"Running {case.id} - {case.name}")
+                    r = await run_case_playwright_async(browser, case)
+                    log(f" -> {r.status.upper()}" + (f" ({r.error})" if r.error else ""))
+                    return r
+
+            # gather는 입력 순서 그대로 결과를 돌려주므로 정렬 걱정 없음
+            return list(await asyncio.gather(*(_one(c) for c in cases)))
+        finally:
+            await browser.close()
+
+
+def run_all(cases: List[TestCase], log=print) -> List[TestResult]:
+    if not cases:
+        return []
+    return asyncio.run(run_all_async(cases, log=log))
 
 
 # -----------------------------
@@ -1,16 +1,36 @@
 from __future__ import annotations
 
+import contextlib
+import functools
 import io
 import json
 import os
-import subprocess
-import sys
+import shutil
+import tempfile
+import threading
+import time
 import zipfile
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timezone
+from uuid import uuid4
 
 import requests
 from dotenv import load_dotenv
-from flask import Flask, flash, redirect, render_template, url_for
+from flask import Flask, flash, jsonify, redirect, render_template, request, session, url_for
+from jinja2 import FileSystemBytecodeCache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # orjson이 없어도 stdlib json으로 동작
+    orjson = None
+
+try:
+    from inotify_simple import INotify, flags as inotify_flags
+except ImportError:  # 리눅스 전용 선택 의존성 — 없으면 stat 폴링으로 동작
+    INotify = None
 
 # ---------------------------------
 # Env (.env) load
@@ -24,63 +44,504 @@ load_dotenv(os.path.join(BASE_DIR, ".env"))
 app = Flask(__name__)
 app.secret_key = "qa-auto-local"
 
+# 컴파일된 템플릿을 디스크에 캐시 → 리로드/워커 재시작 때 재컴파일 생략
+_jinja_bc_dir = os.path.join(tempfile.gettempdir(), "qa_auto_jinja_cache")
+os.makedirs(_jinja_bc_dir, exist_ok=True)
+app.jinja_env.bytecode_cache = FileSystemBytecodeCache(directory=_jinja_bc_dir)
+
 HISTORY_PATH = os.path.join(BASE_DIR, "history", "test_history.json")
-MAIN_PATH = os.path.join(BASE_DIR, "main.py")
+SUMMARY_PATH = os.path.join(BASE_DIR, "history", "history_summary.json")
+
+
+def _json_loads(raw):
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
 
 
 def _read_json(path, default):
+    # exists() 선검사 없이 바로 open → fast path 기준 syscall 1회
     try:
-        if not os.path.exists(path):
-            return default
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except Exception:
+        with open(path, "rb") as f:
+            return _json_loads(f.read())
+    except (OSError, ValueError):
         return default
 
 
+def _parse_history(raw: bytes):
+    """
+    history는 NDJSON(한 줄 = run 하나)이 기본.
+    예전 JSON 배열 파일도 읽을 수 있게 방어.
+    """
+    head = raw.lstrip()
+    if not head:
+        return []
+
+    if head.startswith(b"["):
+        try:
+            data = _json_loads(raw)
+        except ValueError:
+            return []
+        return data if isinstance(data, list) else []
+
+    runs = []
+    for line in raw.splitlines():
+        if not line.strip():
+            continue
+        try:
+            runs.append(_json_loads(line))
+        except ValueError:
+            continue
+    return runs
+
+
+def _parse_history_stream(fp):
+    """
+    _parse_history의 스트림 버전 — zip 엔트리 전체를 한 번에 읽지 않고
+    NDJSON을 줄 단위로 점진 파싱. (예전 배열 포맷만 통으로 읽음)
+    파싱 자체가 불가능하면 None 반환 — 빈 파일/빈 배열("[]")은 정상인 []와
+    구분해야 하므로 "결과가 비었다"로 실패를 추정하면 안 됨.
+    """
+    first = fp.read(1)
+    while first and first.isspace():
+        first = fp.read(1)
+    if not first:
+        return []
+
+    if first == b"[":
+        try:
+            data = _json_loads(first + fp.read())
+        except ValueError:
+            return None
+        return data if isinstance(data, list) else None
+
+    runs = []
+    bad_lines = 0
+    line = first + fp.readline()
+    while line:
+        s = line.strip()
+        if s:
+            try:
+                runs.append(_json_loads(s))
+            except ValueError:
+                bad_lines += 1
+        line = fp.readline()
+    if not runs and bad_lines:
+        return None
+    return runs
+
+
+# ---------------------------------
+# 간단 캐시 (대시보드가 폴링되면 매 요청마다 시트/디스크를 치게 됨)
+# ---------------------------------
+# 케이스 목록은 자주 안 바뀌므로 기본 15분. 바로 보고 싶으면 /refresh로 비움.
+SHEETS_CACHE_TTL = int(os.getenv("SHEETS_CACHE_TTL", "900"))  # 초
+
+# UI가 보여주는 최대 run 수 — 이 이상은 파싱/보관하지 않음
+MAX_HISTORY_ROWS = 200
+
+_sheets_cache = {}  # {(sheet_id, sheet_range): (monotonic_ts, cases)}
+_runs_cache = {"key": None, "data": []}
+
+
+def invalidate_sheets_cache():
+    _sheets_cache.clear()
+    # 디스크 스냅샷도 지워서 다음 로드는 반드시 시트를 새로 읽게
+    with contextlib.suppress(OSError):
+        os.remove(SNAPSHOT_PATH)
+
+
+# inotify가 있으면 매 요청 stat 대신 커널 알림으로 history 캐시를 무효화
+_hist_watch = {"active": False, "dirty": True}
+
+
+def _start_history_watcher() -> None:
+    if INotify is None or _hist_watch["active"]:
+        return
+
+    watch_dir = os.path.dirname(HISTORY_PATH)
+    name = os.path.basename(HISTORY_PATH)
+    try:
+        os.makedirs(watch_dir, exist_ok=True)
+        ino = INotify()
+        ino.add_watch(watch_dir, inotify_flags.CLOSE_WRITE | inotify_flags.MOVED_TO)
+    except Exception:
+        return  # 감시 실패 시 stat 경로로 계속 동작
+
+    def _loop():
+        while True:
+            for ev in ino.read():
+                if ev.name == name:
+                    _hist_watch["dirty"] = True
+
+    threading.Thread(target=_loop, daemon=True, name="history-watcher").start()
+    _hist_watch["active"] = True
+
+
+_start_history_watcher()
+
+
 def get_runs():
-    data = _read_json(HISTORY_PATH, [])
-    return data if isinstance(data, list) else []
+    # 감시가 살아 있고 변경 알림이 없으면 stat조차 하지 않음
+    if _hist_watch["active"] and not _hist_watch["dirty"] and _runs_cache["key"] is not None:
+        return _runs_cache["data"]
+
+    # stat 전에 먼저 내림 — stat~파싱 사이에 도착한 알림을 삼키지 않게.
+    # (나중에 내리면 그 사이의 쓰기 알림이 사라져 stale 캐시가 계속 서빙됨)
+    _hist_watch["dirty"] = False
+
+    try:
+        st = os.stat(HISTORY_PATH)
+    except OSError:
+        _hist_watch["dirty"] = True  # 읽기 실패 → 다음 호출에서 재시도
+        return []
+
+    # mtime 해상도 문제로 같은 초에 두 번 써도 놓치지 않게 (mtime_ns, size)로 키
+    key = (st.st_mtime_ns, st.st_size)
+    if _runs_cache["key"] == key:
+        return _runs_cache["data"]
+
+    try:
+        with open(HISTORY_PATH, "rb") as f:
+            data = _parse_history_lines_tail(f, MAX_HISTORY_ROWS)
+    except OSError:
+        _hist_watch["dirty"] = True
+        return []
+    _runs_cache["key"] = key
+    _runs_cache["data"] = data
+    return data
+
+
+def _parse_history_lines_tail(f, limit):
+    """
+    NDJSON 파일에서 마지막 limit줄만 ring buffer로 모아 파싱 —
+    history가 수십 MB여도 메모리는 O(limit). (예전 배열 포맷은 통으로 읽음)
+    """
+    head = f.read(1)
+    f.seek(0)
+    if head == b"[":
+        return _parse_history(f.read())[-limit:]
+
+    buf = deque(maxlen=limit)
+    for line in f:
+        if line.strip():
+            buf.append(line)
+
+    runs = []
+    for line in buf:
+        try:
+            runs.append(_json_loads(line))
+        except ValueError:
+            continue
+    return runs
+
+
+def _read_latest_run_fast():
+    """
+    NDJSON 꼬리에서 마지막 줄만 읽어 최신 run을 얻음.
+    전체 history 크기와 무관하게 O(1). 실패하면 None → 전체 파싱 경로로.
+    """
+    try:
+        with open(HISTORY_PATH, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            size = f.tell()
+            if size == 0:
+                return None
+            chunk = min(64 << 10, size)
+            f.seek(size - chunk)
+            tail = f.read()
+    except OSError:
+        return None
+
+    # 예전 JSON 배열 포맷이면 꼬리만으론 못 읽음
+    if chunk == size and tail.lstrip().startswith(b"["):
+        return None
+
+    lines = [line for line in tail.splitlines() if line.strip()]
+    if not lines:
+        return None
+
+    try:
+        rec = _json_loads(lines[-1])
+    except ValueError:
+        return None
+    return rec if isinstance(rec, dict) else None
 
 
 def get_latest_run():
+    rec = _read_latest_run_fast()
+    if rec is not None:
+        return rec
     runs = get_runs()
     return runs[-1] if runs else None
 
 
-def get_cases_from_sheets():
-    sheet_id = os.getenv("SHEET_ID", "").strip()
-    sheet_range = os.getenv("SHEET_RANGE", "testcase!A1:E100").strip()
-    if not sheet_id:
-        return []
+# 마지막 성공 fetch를 디스크에도 남겨둠 (stale-while-revalidate):
+# 프로세스가 재시작돼도 TTL 안이면 네트워크 없이 스냅샷으로 응답하고,
+# 어느 정도 묵으면 백그라운드에서만 갱신한다.
+SNAPSHOT_PATH = os.path.join(BASE_DIR, "history", ".sheets_snapshot.json")
+SHEETS_REFRESH_AFTER = 300  # 초 — 이 나이를 넘으면 백그라운드 갱신 시작
+
+_sheets_refreshing = set()  # 백그라운드 갱신 중인 key (중복 submit 방지)
+_sheets_refresh_lock = threading.Lock()
 
+# sync/시트 갱신용 executor — 테스트 실행(_run_executor, 수 분 단위)과 분리.
+# 같이 쓰면 /run 두 번으로 워커가 차서 Sync까지 run이 끝날 때까지 밀림
+_bg_executor = ThreadPoolExecutor(max_workers=2)
+
+
+def _fetch_and_snapshot(sheet_id, sheet_range):
     from loaders.sheets_loader import load_cases_from_sheets
 
+    # TestCase(NamedTuple)를 그대로 캐시/반환 — Jinja는 속성 접근으로 읽고,
+    # /run도 변환 없이 바로 쓸 수 있어서 요청마다 dict로 복사할 필요가 없음
     cases = load_cases_from_sheets(sheet_id, sheet_range)
-    return [c.__dict__ for c in cases]
+    _sheets_cache[(sheet_id, sheet_range)] = (time.monotonic(), cases)
 
+    try:
+        os.makedirs(os.path.dirname(SNAPSHOT_PATH), exist_ok=True)
+        tmp = SNAPSHOT_PATH + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(
+                _json_dumps_line(
+                    {
+                        "ts": time.time(),
+                        "sheet_id": sheet_id,
+                        "sheet_range": sheet_range,
+                        "cases": [c._asdict() for c in cases],
+                    }
+                )
+            )
+        os.replace(tmp, SNAPSHOT_PATH)  # 원자적 교체
+    except OSError:
+        pass  # 스냅샷은 어디까지나 최적화 — 실패해도 동작엔 지장 없음
+
+    return cases
+
+
+def _refresh_sheets_background(sheet_id, sheet_range):
+    key = (sheet_id, sheet_range)
+    try:
+        _fetch_and_snapshot(sheet_id, sheet_range)
+    except Exception:
+        pass  # 갱신 실패 시 기존 스냅샷 유지
+    finally:
+        with _sheets_refresh_lock:
+            _sheets_refreshing.discard(key)
+
+
+def _load_sheets_snapshot(sheet_id, sheet_range):
+    snap = _read_json(SNAPSHOT_PATH, None)
+    if (
+        not isinstance(snap, dict)
+        or snap.get("sheet_id") != sheet_id
+        or snap.get("sheet_range") != sheet_range
+    ):
+        return None, None
+    try:
+        from main import TestCase
 
-def calc_cards(latest_run, cases):
-    total = len(cases)
-    p = f = e = 0
+        cases = [TestCase(**d) for d in snap.get("cases", [])]
+    except (TypeError, ValueError):
+        return None, None
+    return cases, float(snap.get("ts", 0) or 0)
 
-    if latest_run and isinstance(latest_run, dict):
-        s = latest_run.get("summary", {}) or {}
-        p = int(s.get("pass", 0) or 0)
-        f = int(s.get("fail", 0) or 0)
-        e = int(s.get("error", 0) or 0)
 
+def get_cases_from_sheets():
+    sheet_id = os.getenv("SHEET_ID", "").strip()
+    sheet_range = os.getenv("SHEET_RANGE", "testcase!A1:E100").strip()
+    if not sheet_id:
+        return []
+
+    key = (sheet_id, sheet_range)
+    hit = _sheets_cache.get(key)
+    if hit and (time.monotonic() - hit[0]) < SHEETS_CACHE_TTL:
+        return hit[1]
+
+    # 메모리 캐시 미스 → 디스크 스냅샷이 TTL 안이면 네트워크 없이 응답
+    cases, snap_ts = _load_sheets_snapshot(sheet_id, sheet_range)
+    if cases is not None:
+        age = time.time() - snap_ts
+        if age < SHEETS_CACHE_TTL:
+            _sheets_cache[key] = (time.monotonic(), cases)
+            if age > SHEETS_REFRESH_AFTER:
+                # 좀 묵었으면 백그라운드에서만 갱신 (요청은 기다리지 않음)
+                with _sheets_refresh_lock:
+                    if key not in _sheets_refreshing:
+                        _sheets_refreshing.add(key)
+                        _bg_executor.submit(_refresh_sheets_background, sheet_id, sheet_range)
+            return cases
+
+    return _fetch_and_snapshot(sheet_id, sheet_range)
+
+
+def get_latest_summary():
+    """
+    카드 영역용 최신 run 요약. runner가 써두는 사이드카(history_summary.json)를
+    우선 읽고, 없거나 history보다 오래됐으면 history 꼬리에서 가져옴.
+    """
+    try:
+        if os.path.getmtime(SUMMARY_PATH) >= os.path.getmtime(HISTORY_PATH):
+            with open(SUMMARY_PATH, "rb") as f:
+                sidecar = _json_loads(f.read())
+            if isinstance(sidecar, dict):
+                # last_run_cards에는 rate까지 미리 계산돼 있음
+                return sidecar.get("last_run_cards") or sidecar.get("last_run_summary") or {}
+    except (OSError, ValueError):
+        pass
+
+    latest = get_latest_run()
+    if latest and isinstance(latest, dict):
+        return latest.get("cards") or latest.get("summary") or {}
+    return {}
+
+
+@functools.lru_cache(maxsize=32)
+def _calc_cards(p, f, e, total):
     denom = (p + f + e)
     rate = int(round((p / denom) * 100)) if denom else 0
 
     # 신규(new)는 일단 전체로(추후 규칙 정의 가능)
-    new_cnt = total
-    return {"total": total, "pass": p, "fail": f, "new": new_cnt, "rate": rate}
+    return {"total": total, "pass": p, "fail": f, "new": total, "rate": rate}
+
+
+def calc_cards(summary, cases):
+    s = summary or {}
+    total = len(cases)
+
+    # runner가 기록 시점에 계산해둔 rate가 있으면 조립만 하면 됨
+    if "rate" in s:
+        return {
+            "total": total,
+            "pass": s.get("pass", 0),
+            "fail": s.get("fail", 0),
+            "new": total,
+            "rate": s.get("rate", 0),
+        }
+
+    # 폴링되는 대시보드에서 매번 같은 값을 다시 조립하지 않게, 순수 계산부는 캐시
+    return _calc_cards(
+        int(s.get("pass", 0) or 0),
+        int(s.get("fail", 0) or 0),
+        int(s.get("error", 0) or 0),
+        total,
+    )
 
 
 # ---------------------------
 # GitHub Artifact Sync
 # ---------------------------
+# 목록 조회 + zip 다운로드가 같은 호스트라 커넥션 재사용(TLS 핸드셰이크 1회 절약),
+# rate-limit(429)과 일시적인 5xx는 백오프로 재시도.
+class _CappedRetry(Retry):
+    # GitHub가 Retry-After: 60 같은 값을 주면 total=5 기준으로 sync 요청이
+    # 몇 분씩 막힐 수 있음 → 헤더는 존중하되 1회 대기에 상한을 둠
+    RETRY_AFTER_MAX = 10.0
+
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, self.RETRY_AFTER_MAX)
+
+
+_gh_session = requests.Session()
+_gh_session.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        max_retries=_CappedRetry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            respect_retry_after_header=True,
+            # 재시도 소진 시 RetryError를 던지지 말고 마지막 응답을 그대로 반환
+            # → 호출부의 status_code 분기("목록 조회 실패: ...")가 그대로 동작
+            raise_on_status=False,
+        ),
+    ),
+)
+
+
+# artifact 목록 ETag 저장 위치 — 변화가 없으면 304로 끝나서 zip을 다시 안 받음
+ETAG_PATH = os.path.join(BASE_DIR, "history", ".artifact_etag")
+
+
+def _read_artifact_etag() -> str:
+    try:
+        with open(ETAG_PATH, "r", encoding="utf-8") as f:
+            return f.read().strip()
+    except OSError:
+        return ""
+
+
+def _write_artifact_etag(etag: str) -> None:
+    if not etag:
+        return
+    try:
+        os.makedirs(os.path.dirname(ETAG_PATH), exist_ok=True)
+        with open(ETAG_PATH, "w", encoding="utf-8") as f:
+            f.write(etag)
+    except OSError:
+        pass
+
+
+# 이 크기 이상이면 Range 요청 4개로 나눠서 병렬 다운로드
+_RANGED_DL_THRESHOLD = 4 << 20
+_RANGED_DL_PARTS = 4
+
+
+def _download_ranged(url, headers, length: int):
+    """Content-Length를 N등분해서 병렬로 받아 하나의 버퍼로 합침."""
+    buf = bytearray(length)
+    part = length // _RANGED_DL_PARTS
+    bounds = [
+        (i * part, (i + 1) * part - 1 if i < _RANGED_DL_PARTS - 1 else length - 1)
+        for i in range(_RANGED_DL_PARTS)
+    ]
+
+    def _fetch(span):
+        a, b = span
+        rr = _gh_session.get(
+            url, headers={**headers, "Range": f"bytes={a}-{b}"}, timeout=60
+        )
+        rr.raise_for_status()
+        if rr.status_code != 206 or len(rr.content) != (b - a + 1):
+            raise ValueError("Range 응답이 기대와 다름")
+        buf[a : b + 1] = rr.content
+
+    with ThreadPoolExecutor(max_workers=_RANGED_DL_PARTS) as ex:
+        list(ex.map(_fetch, bounds))
+
+    return io.BytesIO(bytes(buf))
+
+
+def _download_artifact_zip(url, headers):
+    """
+    artifact zip을 받아 seek 가능한 파일 객체로 반환. (file_obj, error)
+    크기가 크고 서버가 Range를 지원하면 병렬 분할 다운로드, 아니면 스트리밍.
+    """
+    try:
+        head = _gh_session.head(url, headers=headers, timeout=20, allow_redirects=True)
+        length = int(head.headers.get("Content-Length", 0) or 0)
+        supports_range = head.headers.get("Accept-Ranges", "").lower() == "bytes"
+        if head.ok and supports_range and length >= _RANGED_DL_THRESHOLD:
+            return _download_ranged(url, headers, length), None
+    except Exception:
+        pass  # 분할 다운로드 실패 → 아래 스트리밍으로
+
+    # zip 전체를 메모리에 올리지 않고 spooled tempfile로 스트리밍
+    # (작으면 메모리, 8MB 넘으면 디스크로 넘어감)
+    buf = tempfile.SpooledTemporaryFile(max_size=8 << 20)
+    with _gh_session.get(url, headers=headers, stream=True, timeout=60) as z:
+        if z.status_code != 200:
+            return None, f"Artifact zip 다운로드 실패: {z.status_code} {z.text[:500]}"
+        shutil.copyfileobj(z.raw, buf, length=1 << 20)
+    buf.seek(0)
+    return buf, None
+
+
 def fetch_latest_test_history_from_github():
     """
     GitHub Actions artifact(name=test-history) 중 최신 것을 내려받아
@@ -101,11 +562,33 @@ def fetch_latest_test_history_from_github():
     }
 
     url = f"https://api.github.com/repos/{owner}/{repo}/actions/artifacts?per_page=50"
-    r = requests.get(url, headers=headers, timeout=20)
+
+    list_headers = dict(headers)
+    prev_etag = _read_artifact_etag()
+    if prev_etag:
+        list_headers["If-None-Match"] = prev_etag
+
+    r = _gh_session.get(url, headers=list_headers, timeout=20)
+    if r.status_code == 304:
+        # 마지막 sync 이후 artifact 변화 없음 → 로컬 history 그대로 사용
+        # (get_runs는 꼬리 limit개만 들고 있으므로, 재저장 시 잘리지 않게 전체를 읽음)
+        try:
+            with open(HISTORY_PATH, "rb") as f:
+                return _parse_history(f.read()), None
+        except OSError:
+            return [], None
     if r.status_code != 200:
         return None, f"Artifacts 목록 조회 실패: {r.status_code} {r.text[:500]}"
 
-    artifacts = r.json().get("artifacts", [])
+    # ETag는 이 목록으로 sync가 끝까지 성공한 뒤에만 저장한다.
+    # (여기서 바로 저장하면 artifact가 없거나 다운로드가 실패해도
+    #  다음 sync가 304로 끝나면서 실패가 성공처럼 가려짐)
+    list_etag = r.headers.get("ETag", "")
+
+    try:
+        artifacts = _json_loads(r.content).get("artifacts", [])
+    except ValueError:
+        return None, "Artifacts 목록 응답을 JSON으로 파싱할 수 없습니다."
     candidates = [
         a for a in artifacts
         if a.get("name") == "test-history" and not a.get("expired", False)
@@ -119,11 +602,11 @@ def fetch_latest_test_history_from_github():
     if not archive_url:
         return None, "archive_download_url이 없습니다."
 
-    z = requests.get(archive_url, headers=headers, timeout=60)
-    if z.status_code != 200:
-        return None, f"Artifact zip 다운로드 실패: {z.status_code} {z.text[:500]}"
+    buf, dl_err = _download_artifact_zip(archive_url, headers)
+    if dl_err:
+        return None, dl_err
 
-    with zipfile.ZipFile(io.BytesIO(z.content)) as zipf:
+    with zipfile.ZipFile(buf) as zipf:
         names = zipf.namelist()
 
         target = None
@@ -141,32 +624,91 @@ def fetch_latest_test_history_from_github():
         if not target:
             return None, f"zip 안에서 test_history.json을 찾지 못했습니다. zip entries: {names[:20]}"
 
-        raw = zipf.read(target).decode("utf-8")
-        try:
-            data = json.loads(raw)
-        except Exception as e:
-            return None, f"history JSON 파싱 실패: {e}"
-
-        if not isinstance(data, list):
-            return None, "history JSON이 list 형식이 아닙니다."
+        with zipf.open(target) as fp:
+            data = _parse_history_stream(fp)
+        if data is None:
+            return None, "history 파일을 파싱하지 못했습니다. (JSON 배열/NDJSON 둘 다 아님)"
 
+        _write_artifact_etag(list_etag)
         return data, None
 
 
+def _json_dumps_line(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
 def save_github_history_to_local(history_data):
+    from main import summary_to_cards
+
     os.makedirs(os.path.dirname(HISTORY_PATH), exist_ok=True)
-    with open(HISTORY_PATH, "w", encoding="utf-8") as f:
-        json.dump(history_data, f, ensure_ascii=False, indent=2)
+
+    # 예전 runner가 만든 레코드에는 cards가 없을 수 있음 → 저장 시점에 한 번만 계산
+    for rec in history_data:
+        if isinstance(rec, dict) and "cards" not in rec:
+            rec["cards"] = summary_to_cards(rec.get("summary") or {})
+
+    # 로컬 포맷(NDJSON)으로 맞춰서 저장
+    with open(HISTORY_PATH, "wb") as f:
+        for rec in history_data:
+            f.write(_json_dumps_line(rec) + b"\n")
+
+    # 카드용 사이드카도 같이 갱신
+    if history_data:
+        last = history_data[-1]
+        with open(SUMMARY_PATH, "wb") as f:
+            f.write(
+                _json_dumps_line(
+                    {
+                        "last_run_executed_at": last.get("executed_at"),
+                        "last_run_summary": last.get("summary") or {},
+                        "last_run_cards": last.get("cards")
+                        or summary_to_cards(last.get("summary") or {}),
+                        "total_runs": len(history_data),
+                    }
+                )
+            )
+
+
+@app.route("/refresh", methods=["POST"])
+def refresh():
+    # 수동 캐시 버스팅: 다음 대시보드 로드에서 시트를 새로 읽음
+    invalidate_sheets_cache()
+    invalidate_page_cache()
+    flash("시트 캐시를 비웠습니다.", "success")
+    return redirect(url_for("dashboard"))
+
+
+# 동시에 Sync를 눌러도(더블 클릭 포함) artifact 다운로드는 한 번만 뛰게
+# in-flight future를 공유 — 두 번째 요청은 첫 요청의 결과를 기다림
+_sync_lock = threading.Lock()
+_sync_inflight: Future | None = None
 
 
 @app.route("/sync_github", methods=["POST"])
 def sync_github():
-    data, err = fetch_latest_test_history_from_github()
+    global _sync_inflight
+
+    with _sync_lock:
+        fut = _sync_inflight
+        if fut is None or fut.done():
+            fut = _bg_executor.submit(fetch_latest_test_history_from_github)
+            _sync_inflight = fut
+
+    # fetch 중 예외(네트워크, 깨진 zip 등)는 500 traceback 대신 flash로
+    try:
+        data, err = fut.result()
+    except Exception as e:
+        flash(f"GitHub 동기화 중 오류가 발생했습니다: {e}", "error")
+        return redirect(url_for("dashboard"))
     if err:
         flash(err, "error")
         return redirect(url_for("dashboard"))
 
     save_github_history_to_local(data)
+    invalidate_sheets_cache()
+    invalidate_page_cache()
     flash("GitHub Actions 결과를 로컬 history로 동기화했습니다.", "success")
     return redirect(url_for("dashboard"))
 
@@ -174,23 +716,86 @@ def sync_github():
 # ---------------------------
 # Routes
 # ---------------------------
-@app.route("/")
-def dashboard():
+# 렌더된 HTML 자체를 짧게 캐시 — 폴링 탭이 여러 개여도 Jinja는 한 번만 돈다
+PAGE_CACHE_TTL = 10  # 초
+_page_cache = {"key": None, "ts": 0.0, "html": None}
+
+
+def _history_stat_key():
+    try:
+        st = os.stat(HISTORY_PATH)
+        return (st.st_mtime_ns, st.st_size)
+    except OSError:
+        return None
+
+
+def invalidate_page_cache():
+    _page_cache["key"] = None
+    _page_cache["html"] = None
+
+
+def _render_dashboard() -> str:
     cases = get_cases_from_sheets()
     runs = get_runs()
-    latest = runs[-1] if runs else None
-    cards = calc_cards(latest, cases)
+    latest = get_latest_run()
+    cards = calc_cards(get_latest_summary(), cases)
 
     actions_url = os.getenv("GITHUB_ACTIONS_URL", "").strip()
     return render_template(
         "dashboard2.html",
         cards=cards,
         cases=cases,
-        runs=runs[::-1],
+        runs=list(reversed(runs[-MAX_HISTORY_ROWS:])),  # 최근 N개만 뒤집음
         latest_run=latest,
         actions_url=actions_url,
     )
 
+
+@app.route("/")
+def dashboard():
+    # flash 메시지가 대기 중이면 캐시된 HTML을 주면 메시지가 증발함 → 항상 새로 렌더
+    if "_flashes" in session:
+        return _render_dashboard()
+
+    key = _history_stat_key()
+    now = time.monotonic()
+    if (
+        _page_cache["html"] is not None
+        and _page_cache["key"] == key
+        and (now - _page_cache["ts"]) < PAGE_CACHE_TTL
+    ):
+        return _page_cache["html"]
+
+    html = _render_dashboard()
+    _page_cache["key"] = key
+    _page_cache["ts"] = now
+    _page_cache["html"] = html
+    return html
+
+@app.route("/api/state")
+def api_state():
+    """
+    폴링용 경량 상태 API. 전체 HTML 재렌더 대신 카드/최근 run만 JSON으로 반환.
+    history (mtime_ns, size)를 ETag로 써서, 변화가 없으면 304(바디 없음)로 끝남.
+    """
+    key = _history_stat_key()
+    etag = f'"{key[0]}-{key[1]}"' if key else '"empty"'
+    if request.headers.get("If-None-Match") == etag:
+        return "", 304
+
+    cases = get_cases_from_sheets()
+    runs = get_runs()
+
+    resp = jsonify(
+        cards=calc_cards(get_latest_summary(), cases),
+        cases=[c._asdict() for c in cases],
+        runs=runs[-50:][::-1],
+        latest=get_latest_run(),
+    )
+    resp.headers["ETag"] = etag
+    return resp
+
+
 @app.route("/__routes")
 def __routes():
     # 현재 서버에 등록된 라우트들을 텍스트로 보여줌
@@ -200,26 +805,100 @@ def __routes():
         lines.append(f"{methods:10s} {r.rule:30s} -> {r.endpoint}")
     return "<pre>" + "\n".join(lines) + "</pre>"
 
+# 테스트 실행은 수 초~수 분 걸릴 수 있어서 Flask 워커를 잡아두지 않고
+# 백그라운드 스레드에서 돌린 뒤 /run_status/<rid>로 폴링
+_run_executor = ThreadPoolExecutor(max_workers=2)
+_runs_inflight: dict[str, Future] = {}
+
+# 끝난 future도 /run_status 폴링을 위해 잠시 보관하지만, 무한정 들고 있으면
+# run 1회당 entry 1개씩 프로세스 수명 내내 누적됨 → 최근 N개만 유지
+_RUNS_INFLIGHT_MAX = 50
+
+
+def _prune_runs_inflight() -> None:
+    if len(_runs_inflight) <= _RUNS_INFLIGHT_MAX:
+        return
+    # dict는 삽입 순서를 유지하므로 앞쪽이 가장 오래된 run
+    for rid in [r for r, fut in _runs_inflight.items() if fut.done()]:
+        if len(_runs_inflight) <= _RUNS_INFLIGHT_MAX:
+            break
+        _runs_inflight.pop(rid, None)
+
+RUN_LOG_DIR = os.path.join(BASE_DIR, "history", "run_logs")
+
+
+def _run_log_path(rid: str) -> str:
+    return os.path.join(RUN_LOG_DIR, f"{rid}.log")
+
+
+def _tail_file(path: str, size: int = 2000) -> str:
+    """파일 꼬리 size 바이트만 읽음 (전체를 메모리에 올리지 않음)."""
+    try:
+        with open(path, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            end = f.tell()
+            f.seek(max(0, end - size))
+            return f.read().decode("utf-8", "replace")
+    except OSError:
+        return ""
+
+
+def _do_run(cases, rid):
+    # 별도 인터프리터를 띄우면 playwright/google 라이브러리를 매번 다시 import하게 됨
+    # → main.run_all을 in-process로 직접 호출
+    from main import append_run_history, run_all
+
+    os.makedirs(RUN_LOG_DIR, exist_ok=True)
+    # 실행 로그는 메모리에 쌓지 말고 파일로 바로 흘림
+    # (run이 아무리 길어도 메모리 일정 + 로그가 파일로 남음)
+    # redirect_stdout은 프로세스 전역이라 run 2개가 겹치면 서로의 로그 파일을
+    # 덮어쓰거나 닫힌 파일을 복원하게 됨 → run별 log callable로 전달
+    with open(_run_log_path(rid), "w", encoding="utf-8", buffering=1) as lf:
+
+        def _log(msg) -> None:
+            lf.write(f"{msg}\n")
+
+        results = run_all(cases, log=_log)
+
+    append_run_history(results)
+
+    p = sum(1 for r in results if r.status == "pass")
+    f = sum(1 for r in results if r.status == "fail")
+    e = sum(1 for r in results if r.status == "error")
+    return f"pass {p} / fail {f} / error {e}"
+
+
 @app.route("/run", methods=["POST"])
 def run_tests():
-    env = os.environ.copy()
-
-    proc = subprocess.run(
-        [sys.executable, "-u", MAIN_PATH],
-        cwd=BASE_DIR,
-        env=env,
-        capture_output=True,
-        text=True,
-    )
+    cases = get_cases_from_sheets()
+    if not cases:
+        flash("실행할 케이스가 없습니다. SHEET_ID/SHEET_RANGE 환경변수를 확인하세요.", "error")
+        return redirect(url_for("dashboard"))
 
-    output = ((proc.stdout or "") + "\n" + (proc.stderr or "")).strip()
+    rid = uuid4().hex
+    _prune_runs_inflight()
+    _runs_inflight[rid] = _run_executor.submit(_do_run, cases, rid)
+    invalidate_page_cache()
+    flash(f"테스트 실행을 시작했습니다. (run id: {rid[:8]}) 잠시 후 새로고침하면 결과가 반영됩니다.", "success")
 
-    if proc.returncode != 0:
-        flash((output[-2000:] if output else "Test run failed."), "error")
-    else:
-        flash("Test run completed.", "success")
+    return redirect(url_for("dashboard", pending=rid))
 
-    return redirect(url_for("dashboard"))
+
+@app.route("/run_status/<rid>")
+def run_status(rid):
+    fut = _runs_inflight.get(rid)
+    if fut is None:
+        return {"status": "unknown"}, 404
+    log_tail = _tail_file(_run_log_path(rid))
+
+    if not fut.done():
+        return {"status": "running", "log_tail": log_tail}
+
+    try:
+        summary = fut.result()
+    except Exception as e:
+        return {"status": "error", "error": str(e), "log_tail": log_tail}
+    return {"status": "done", "summary": summary, "log_tail": log_tail}
 
 
 # (선택) 환경변수 확인용 디버그 라우트